@@ -0,0 +1,117 @@
+import logging
+import zlib
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import psycopg2
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "ingestor" / "utils" / "create_schema.sql"
+
+def make_price_source(bad_row_rate: float = 0.0, seed: int = 0):
+    """
+    Builds a drop-in replacement for yf.download that generates a deterministic random walk per ticker.
+    The returned frame has the same (Price, Ticker) column layout as yfinance, so the lake CSV is parsed the same way.
+    bad_row_rate swaps high and low on that share of rows to exercise the quarantine path.
+    """
+    def synthetic_download(ticker: str, start: str, end: str, rounding: bool = False) -> pd.DataFrame:
+        dates = pd.bdate_range(start=start, end=pd.Timestamp(end) - pd.Timedelta(days=1), name="Date")
+        if dates.empty:
+            return pd.DataFrame()
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()) + seed)
+        n_days = len(dates)
+
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_days)))
+        open_ = np.concatenate(([close[0]], close[:-1])) * (1 + rng.normal(0, 0.002, n_days))
+        high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, n_days))
+        low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, n_days))
+        volume = rng.integers(1_000_000, 20_000_000, n_days)
+
+        bad_rows = rng.random(n_days) < bad_row_rate
+        high[bad_rows], low[bad_rows] = low[bad_rows], high[bad_rows]
+
+        if rounding:
+            open_, high, low, close = (np.round(values, 2) for values in (open_, high, low, close))
+        data = pd.DataFrame({
+            ("Close", ticker): close,
+            ("High", ticker): high,
+            ("Low", ticker): low,
+            ("Open", ticker): open_,
+            ("Volume", ticker): volume,
+        }, index=dates)
+        data.columns.names = ["Price", "Ticker"]
+        return data
+
+    return synthetic_download
+
+
+class _LocalDownload:
+    def __init__(self, path: Path):
+        self.path = path
+
+    def readinto(self, stream) -> int:
+        data = self.path.read_bytes()
+        stream.write(data)
+        return len(data)
+
+
+class LocalDataLakeFileClient:
+    """
+    Filesystem-backed stand-in for DataLakeFileClient covering the calls made by azure_storage_manager.
+    The connection string is the root directory, files live under <root>/<file_system_name>/<file_path>.
+    """
+    def __init__(self, root: str, file_system_name: str, file_path: str):
+        self.path = Path(root) / file_system_name / file_path
+
+    @classmethod
+    def from_connection_string(cls, conn_str: str, file_system_name: str, file_path: str):
+        return cls(conn_str, file_system_name, file_path)
+
+    def create_file(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(b"")
+
+    def append_data(self, data, offset: int, length: int | None = None):
+        if isinstance(data, str):
+            data = data.encode()
+        with open(self.path, "r+b") as file:
+            file.seek(offset)
+            file.write(data)
+
+    def flush_data(self, offset: int):
+        if not self.path.exists():
+            raise FileNotFoundError(f"{self.path} was never created")
+
+    def download_file(self) -> _LocalDownload:
+        if not self.path.exists():
+            raise FileNotFoundError(f"{self.path} does not exist")
+        return _LocalDownload(self.path)
+
+
+def make_local_connect(dsn: str):
+    """Returns a connect_to_db replacement pointing at a local Postgres instance."""
+    def connect_to_local_db() -> psycopg2.extensions.connection | None:
+        try:
+            conn = psycopg2.connect(dsn)
+            conn.autocommit = True
+            return conn
+        except Exception as e:
+            logging.error(f"Error connecting to local database: {e}")
+            return None
+
+    return connect_to_local_db
+
+
+def init_local_schema(dsn: str) -> bool:
+    conn = make_local_connect(dsn)()
+    if conn is None:
+        return False
+    try:
+        with conn.cursor() as cur:
+            cur.execute(SCHEMA_PATH.read_text())
+        logging.info(f"Applied {SCHEMA_PATH.name} to local database.")
+        return True
+    except Exception as e:
+        logging.error(f"Failed to apply schema to local database: {e}")
+        return False
+    finally:
+        conn.close()
@@ -13,7 +13,7 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)])
 
 
-def fetch_data(pipeline_cfg) -> pd.DataFrame | None:
+def fetch_data(pipeline_cfg, price_source=yf.download) -> pd.DataFrame | None:
     if pipeline_cfg["DATA_EXTRACTION_DATE"]:
         start_date = pipeline_cfg["DATA_EXTRACTION_DATE"]
         end_date = datetime.strptime(start_date, pipeline_cfg["DATE_FORMAT"]) + timedelta(days=1)
@@ -25,7 +25,7 @@ def fetch_data(pipeline_cfg) -> pd.DataFrame | None:
     for attempt in range(pipeline_cfg["MAX_RETRIES"]):
         logging.info(f"Fetching data for {pipeline_cfg['TICKER']} starting from {start_date}, attempt {attempt + 1}")
         try:
-            data = yf.download(pipeline_cfg["TICKER"], start=start_date, end=end_date, rounding=True)
+            data = price_source(pipeline_cfg["TICKER"], start=start_date, end=end_date, rounding=True)
             if data.empty:
                 logging.warning(f"Dataframe is empty for {pipeline_cfg['TICKER']} from {start_date} to {end_date}. Check network connection or ticker validity.")
                 return None
@@ -3,7 +3,7 @@ from azure.storage.filedatalake import DataLakeFileClient
 import pandas as pd
 import os
 
-def upload_data(data: pd.DataFrame, db_config, pipeline_cfg) -> bool:
+def upload_data(data: pd.DataFrame, db_config, pipeline_cfg, file_client_cls=DataLakeFileClient) -> bool:
     if pipeline_cfg["DATA_EXTRACTION_DATE"]:
         logging.info(f"Uploading data for specific date: {pipeline_cfg['DATA_EXTRACTION_DATE']}")
         file_path = f"rawdata/data_{pipeline_cfg['DATA_EXTRACTION_DATE']}.csv"
@@ -11,7 +11,7 @@ def upload_data(data: pd.DataFrame, db_config, pipeline_cfg) -> bool:
         logging.info("Uploading data for the full date range.")
         file_path = pipeline_cfg["FILE_PATH"]
     try:
-        file = DataLakeFileClient.from_connection_string(
+        file = file_client_cls.from_connection_string(
             db_config["AZURE_STORAGE_CONNECTION_STRING"], 
             file_system_name=pipeline_cfg["FILE_SYSTEM_NAME"],
             file_path=file_path)
@@ -25,7 +25,29 @@ def upload_data(data: pd.DataFrame, db_config, pipeline_cfg) -> bool:
     except Exception as e:
         logging.error(f"Failed to upload data to Azure Data Lake: {e}")
 
-def download_data(db_config, pipeline_cfg) -> pd.DataFrame:
+def upload_quarantine(data: pd.DataFrame, db_config, pipeline_cfg, file_client_cls=DataLakeFileClient) -> bool:
+    if pipeline_cfg["DATA_EXTRACTION_DATE"]:
+        file_path = f"quarantine/data_{pipeline_cfg['DATA_EXTRACTION_DATE']}.csv"
+    else:
+        file_path = pipeline_cfg["QUARANTINE_FILE_PATH"]
+    logging.info(f"Uploading {len(data)} quarantined rows to {file_path}.")
+    try:
+        file = file_client_cls.from_connection_string(
+            db_config["AZURE_STORAGE_CONNECTION_STRING"], 
+            file_system_name=pipeline_cfg["FILE_SYSTEM_NAME"],
+            file_path=file_path)
+        csv_data = data.to_csv(index=False)
+        
+        file.create_file()
+        file.append_data(csv_data, offset=0, length=len(csv_data))
+        file.flush_data(len(csv_data))
+        logging.info("Successfully uploaded quarantined rows to Azure Data Lake.")
+        return True
+    except Exception as e:
+        logging.error(f"Failed to upload quarantined rows to Azure Data Lake: {e}")
+        return False
+
+def download_data(db_config, pipeline_cfg, file_client_cls=DataLakeFileClient) -> pd.DataFrame:
     if pipeline_cfg["DATA_EXTRACTION_DATE"]:
         local_file_path = f"/tmp/downloaded_data_{pipeline_cfg['DATA_EXTRACTION_DATE']}.csv"
         file_path = f"rawdata/data_{pipeline_cfg['DATA_EXTRACTION_DATE']}.csv"
@@ -33,7 +55,7 @@ def download_data(db_config, pipeline_cfg) -> pd.DataFrame:
         file_path = pipeline_cfg["FILE_PATH"]
         local_file_path = "/tmp/downloaded_data.csv"
     try:
-        file = DataLakeFileClient.from_connection_string(
+        file = file_client_cls.from_connection_string(
             db_config["AZURE_STORAGE_CONNECTION_STRING"], 
             file_system_name=pipeline_cfg["FILE_SYSTEM_NAME"],
             file_path=file_path)
@@ -1,7 +1,8 @@
 import logging
 import pandas as pd
 from ingestor.utils.config_loader import get_db_config, get_pipeline_config
-from ingestor.azure_storage_manager import download_data
+from ingestor.azure_storage_manager import download_data, upload_quarantine
+from ingestor.data_validator import validate_raw_prices
 import psycopg2
 from psycopg2 import extras
 from typing import Dict
@@ -211,7 +212,18 @@ if __name__ == "__main__":
     if cleaned_df.empty:
         logging.error("Cleaned DataFrame is empty. Exiting.")
         sys.exit(1)
+    valid_df, quarantined_df = validate_raw_prices(cleaned_df)
+    quarantine_success = True
+    if not quarantined_df.empty:
+        quarantine_success = upload_quarantine(quarantined_df, db_config, pipeline_cfg)
+        if not quarantine_success:
+            logging.error(f"Failed to save {len(quarantined_df)} quarantined rows, they are lost for this run.")
+    if valid_df.empty:
+        logging.error("No rows passed validation. Exiting.")
+        sys.exit(1)
     else:
         conn = connect_to_db()
-        load_raw_data(cleaned_df, conn)
-        conn.close()
\ No newline at end of file
+        load_raw_data(valid_df, conn)
+        conn.close()
+    if not quarantine_success:
+        sys.exit(1)
\ No newline at end of file
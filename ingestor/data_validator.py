@@ -0,0 +1,71 @@
+import logging
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+PRICE_COLS = ['open_price', 'high_price', 'low_price', 'close_price']
+NOT_NULL_COLS = ['date_key', 'ticker'] + PRICE_COLS + ['volume']
+# DECIMAL(20, 10) leaves 10 digits before the decimal point
+MAX_PRICE = 1e10
+REASON_COL = 'reason_codes'
+
+def validate_raw_prices(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Checks every row against the constraints of fact_daily_prices_raw before loading.
+    Returns (valid_rows, quarantined_rows); quarantined rows carry a ';'-separated reason_codes column.
+    """
+    if df is None or df.empty:
+        logging.warning("Input DataFrame is empty or None. Skipping validation.")
+        return pd.DataFrame(), pd.DataFrame()
+
+    logging.info(f"Validating {len(df)} rows against raw price constraints.")
+    n_rows = len(df)
+    reasons = np.full(n_rows, '', dtype=object)
+
+    def flag(mask: np.ndarray, code: str):
+        reasons[mask] += code + ';'
+
+    # NOT NULL
+    for col in NOT_NULL_COLS:
+        if col not in df.columns:
+            flag(np.ones(n_rows, dtype=bool), f'missing_{col}')
+        else:
+            flag(df[col].isna().to_numpy(), f'null_{col}')
+
+    present_price_cols = [col for col in PRICE_COLS if col in df.columns]
+    prices = {col: df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in present_price_cols}
+    for col, values in prices.items():
+        flag(np.isinf(values), f'infinite_{col}')
+        flag(np.abs(values) >= MAX_PRICE, f'overflow_{col}')
+
+    # CHECK constraints, comparisons against NaN evaluate to False so nulls are only reported once
+    if len(prices) == len(PRICE_COLS):
+        open_p, high_p, low_p, close_p = (prices[col] for col in PRICE_COLS)
+        flag(high_p < low_p, 'high_below_low')
+        flag(high_p < open_p, 'high_below_open')
+        flag(high_p < close_p, 'high_below_close')
+        flag(low_p > open_p, 'low_above_open')
+        flag(low_p > close_p, 'low_above_close')
+
+    if 'volume' in df.columns:
+        volume = df['volume'].to_numpy(dtype=np.float64, na_value=np.nan)
+        flag(~np.isnan(volume) & ~np.isfinite(volume), 'infinite_volume')
+        flag(np.abs(volume) >= np.iinfo(np.int64).max, 'overflow_volume')
+
+    # a single UPSERT batch cannot touch the same primary key twice, keep the last record that passed every other check
+    if 'date_key' in df.columns and 'ticker' in df.columns:
+        passed = reasons == ''
+        duplicated = np.zeros(n_rows, dtype=bool)
+        duplicated[passed] = df.loc[passed, ['date_key', 'ticker']].duplicated(keep='last').to_numpy()
+        flag(duplicated, 'duplicate_key')
+
+    invalid_mask = reasons != ''
+    valid_df = df.loc[~invalid_mask].copy()
+    quarantined_df = df.loc[invalid_mask].copy()
+    quarantined_df[REASON_COL] = [codes.rstrip(';') for codes in reasons[invalid_mask]]
+
+    if quarantined_df.empty:
+        logging.info("Validation complete, all rows passed.")
+    else:
+        logging.warning(f"Validation complete, {len(quarantined_df)} of {n_rows} rows quarantined.")
+    return valid_df, quarantined_df
@@ -1,10 +1,16 @@
 import logging
 import sys
 import argparse
+import time
+from contextlib import contextmanager
+from typing import Dict
+import yfinance as yf
+from azure.storage.filedatalake import DataLakeFileClient
 from ingestor.utils.config_loader import get_pipeline_config, get_db_config
 from ingestor.api_fetcher import fetch_data
-from ingestor.azure_storage_manager import upload_data, download_data
+from ingestor.azure_storage_manager import upload_data, download_data, upload_quarantine
 from ingestor.data_loader import standardize_and_clean, load_raw_data
+from ingestor.data_validator import validate_raw_prices
 from ingestor.utils.db_connector import connect_to_db
 from transformer.transformer import run_transformer
 
@@ -16,24 +22,20 @@ logging.basicConfig(
 pipeline_cfg = get_pipeline_config()
 db_config = get_db_config()
 
-def run_elt_pipeline():
-    logging.info("🚀 Starting Gold Price ELT Pipeline Execution")
-    
-    logging.info("Checking data extraction date")
-
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--date", help="Specific date for incremental load (YYYY-MM-DD)")
-    parser.add_argument("--full", action="store_true", help="Run full history refresh")
-    args = parser.parse_args()
-
-    is_full_refresh = args.full
-    if args.date:
-        pipeline_cfg["DATA_EXTRACTION_DATE"] = args.date
-        is_full_refresh = False 
-        logging.info(f"Data extraction date set from command line argument: {pipeline_cfg['DATA_EXTRACTION_DATE']}")
-    else:
-        is_full_refresh = True
+@contextmanager
+def stage_timer(stage_timings: Dict[str, float] | None, stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stage_timings is not None:
+            stage_timings[stage] = time.perf_counter() - start
 
+def execute_pipeline(pipeline_cfg, db_config, is_full_refresh: bool,
+                     price_source=yf.download, file_client_cls=DataLakeFileClient, connect=connect_to_db,
+                     stage_timings: Dict[str, float] | None = None, row_counts: Dict[str, int] | None = None) -> bool:
+    if row_counts is None:
+        row_counts = {}
     # Extract
     logging.info("\n--- STEP 1: Starting Data Extraction (E) ---")
     if pipeline_cfg["DATA_EXTRACTION_DATE"]:
@@ -42,39 +44,90 @@ def run_elt_pipeline():
     else:
         logging.info("Extracting data for the full date range.")
 
-    raw_data= fetch_data(pipeline_cfg)
-    upload_success = upload_data(raw_data, db_config, pipeline_cfg)
+    with stage_timer(stage_timings, "fetch"):
+        raw_data = fetch_data(pipeline_cfg, price_source)
+    with stage_timer(stage_timings, "upload"):
+        upload_success = upload_data(raw_data, db_config, pipeline_cfg, file_client_cls)
     if upload_success:
-        raw_data_df = download_data(db_config,pipeline_cfg)
+        with stage_timer(stage_timings, "download"):
+            raw_data_df = download_data(db_config, pipeline_cfg, file_client_cls)
         logging.info("Successfully uploaded raw data from Azure lake, Extraction completed.")
     else:
         logging.info("Failed to upload raw data, aborting pipeline")
-        return 
+        return False
     if raw_data_df is None or raw_data_df.empty:
         logging.error("Rawdata download failed or Azure returned empty data. Aborting pipeline.")
-        return
+        return False
 
     # Load
     logging.info("\n--- STEP 2: Starting Data Loading (L) ---")
-    cleaned_df = standardize_and_clean(raw_data_df)
+    with stage_timer(stage_timings, "clean"):
+        cleaned_df = standardize_and_clean(raw_data_df)
     if cleaned_df.empty:
         logging.error("Cleaned DataFrame is empty. Exiting.")
-        return
-    conn = connect_to_db()
-    try:
-        loading_success = load_raw_data(cleaned_df, conn)   
-        if loading_success:
-            logging.info("Success at loading raw gold prices")
-    finally:
-        conn.close()
+        return False
+    with stage_timer(stage_timings, "validate"):
+        valid_df, quarantined_df = validate_raw_prices(cleaned_df)
+    quarantine_success = True
+    if not quarantined_df.empty:
+        with stage_timer(stage_timings, "quarantine"):
+            quarantine_success = upload_quarantine(quarantined_df, db_config, pipeline_cfg, file_client_cls)
+        if quarantine_success:
+            row_counts["quarantined"] = len(quarantined_df)
+        else:
+            row_counts["quarantine_lost"] = len(quarantined_df)
+            logging.error(f"Failed to save {len(quarantined_df)} quarantined rows, they are lost for this run.")
+    if valid_df.empty:
+        logging.error("No rows passed validation. Exiting.")
+        return False
+    with stage_timer(stage_timings, "load"):
+        conn = connect()
+        if conn is None:
+            logging.error("Database connection failed. Aborting pipeline.")
+            return False
+        try:
+            loading_success = load_raw_data(valid_df, conn)   
+        finally:
+            conn.close()
+    if not loading_success:
+        logging.error("❌ ELT Pipeline failed during Load Stage.")
+        return False
+    row_counts["loaded"] = len(valid_df)
+    logging.info("Success at loading raw gold prices")
     
     #Transform
-    transform_success = run_transformer(is_full_refresh)
-    if transform_success:
-        logging.info("Transformation success")
-        logging.info("✅ ELT Pipeline completed successfully.")
-    else:
+    with stage_timer(stage_timings, "transform"):
+        transform_success = run_transformer(is_full_refresh, pipeline_cfg["TICKER"], connect)
+    if not transform_success:
         logging.error("❌ ELT Pipeline failed during Transform Stage.")
+        return False
+    logging.info("Transformation success")
+    if not quarantine_success:
+        logging.error("❌ ELT Pipeline loaded valid rows but failed to save quarantined rows.")
+        return False
+    logging.info("✅ ELT Pipeline completed successfully.")
+    return True
+
+def run_elt_pipeline():
+    logging.info("🚀 Starting Gold Price ELT Pipeline Execution")
+    
+    logging.info("Checking data extraction date")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--date", help="Specific date for incremental load (YYYY-MM-DD)")
+    parser.add_argument("--full", action="store_true", help="Run full history refresh")
+    args = parser.parse_args()
+
+    is_full_refresh = args.full
+    if args.date:
+        pipeline_cfg["DATA_EXTRACTION_DATE"] = args.date
+        is_full_refresh = False 
+        logging.info(f"Data extraction date set from command line argument: {pipeline_cfg['DATA_EXTRACTION_DATE']}")
+    else:
+        is_full_refresh = True
+
+    if not execute_pipeline(pipeline_cfg, db_config, is_full_refresh):
+        sys.exit(1)
 
 if __name__ == "__main__":
     run_elt_pipeline()
\ No newline at end of file
@@ -38,5 +38,6 @@ def get_pipeline_config():
         "YEARLY_TRADING_DAYS":252,
         "FILE_SYSTEM_NAME":"bronze",
         "FILE_PATH":"rawdata/data.csv",
+        "QUARANTINE_FILE_PATH":"quarantine/data.csv",
         "DATA_EXTRACTION_DATE":None  # Default to None, can be set via command line argument
     }
\ No newline at end of file
@@ -158,11 +158,12 @@ def get_metric_map(conn) -> Dict[str, int]:
         cur.execute(f"SELECT metric_name, metric_key FROM {DIM_METRIC_NAME}")
         return dict(cur.fetchall())   
 
-def run_transformer(is_full_refresh: bool = False):
-    conn = connect_to_db()
+def run_transformer(is_full_refresh: bool = False, ticker: str = "GLD", connect=connect_to_db):
+    conn = connect()
+    if conn is None:
+        logging.error("Database connection failed. Skipping transformation.")
+        return False
     try:
-        ticker = "GLD" 
-        
         df_raw = fetch_raw_data(conn, ticker, full_history=is_full_refresh)
         if df_raw.empty: return
 